@@ -0,0 +1,188 @@
+import numpy as np
+
+# Activation codes stored in the exported file. Each function mirrors the
+# neat-python implementation so exported networks give the same outputs.
+ACTIVATION_CODES = {
+    'identity': 0,
+    'tanh': 1,
+    'relu': 2,
+    'sigmoid': 3,
+    'clamped': 4,
+}
+
+
+def _identity(z):
+    return z
+
+
+def _tanh(z):
+    return np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+
+
+def _relu(z):
+    return np.maximum(z, 0.0)
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0)))
+
+
+def _clamped(z):
+    return np.clip(z, -1.0, 1.0)
+
+
+ACTIVATION_FUNCTIONS = {
+    0: _identity,
+    1: _tanh,
+    2: _relu,
+    3: _sigmoid,
+    4: _clamped,
+}
+
+FORMAT_VERSION = 1
+
+
+def export_network(genome, config, path="best_network.npz"):
+    """
+    Flatten a trained genome into a compact array file that can be run
+    with NumPy alone (see CompactNetwork).
+    """
+    import neat
+
+    net = neat.nn.FeedForwardNetwork.create(genome, config)
+    num_inputs = len(net.input_nodes)
+
+    # Every value the network computes lives in a slot: inputs first,
+    # then nodes in evaluation order, then any unconnected outputs (always 0)
+    slots = {key: i for i, key in enumerate(net.input_nodes)}
+    for i, node_eval in enumerate(net.node_evals):
+        slots[node_eval[0]] = num_inputs + i
+
+    def slot_of(key):
+        if key not in slots:
+            slots[key] = len(slots)
+        return slots[key]
+
+    bias = []
+    response = []
+    activation = []
+    link_ptr = [0]
+    link_src = []
+    link_weight = []
+
+    for node, act_func, agg_func, node_bias, node_response, links in net.node_evals:
+        node_gene = genome.nodes[node]
+        if node_gene.aggregation != 'sum':
+            raise ValueError(f"Unsupported aggregation for export: {node_gene.aggregation}")
+        if node_gene.activation not in ACTIVATION_CODES:
+            raise ValueError(f"Unsupported activation for export: {node_gene.activation}")
+
+        bias.append(node_bias)
+        response.append(node_response)
+        activation.append(ACTIVATION_CODES[node_gene.activation])
+        for src, weight in links:
+            link_src.append(slot_of(src))
+            link_weight.append(weight)
+        link_ptr.append(len(link_src))
+
+    output_slots = [slot_of(key) for key in net.output_nodes]
+
+    np.savez_compressed(
+        path,
+        format_version=np.int32(FORMAT_VERSION),
+        num_inputs=np.int32(num_inputs),
+        num_slots=np.int32(len(slots)),
+        bias=np.asarray(bias, dtype=np.float64),
+        response=np.asarray(response, dtype=np.float64),
+        activation=np.asarray(activation, dtype=np.int8),
+        link_ptr=np.asarray(link_ptr, dtype=np.int32),
+        link_src=np.asarray(link_src, dtype=np.int32),
+        link_weight=np.asarray(link_weight, dtype=np.float64),
+        output_slots=np.asarray(output_slots, dtype=np.int32),
+    )
+    return path
+
+
+class CompactNetwork:
+    def __init__(self, num_inputs, num_slots, bias, response, activation,
+                 link_ptr, link_src, link_weight, output_slots):
+        """Feed-forward network stored as flat arrays (see export_network)"""
+        self.num_inputs = int(num_inputs)
+        self.num_slots = int(num_slots)
+        self.bias = bias
+        self.response = response
+        self.activation = activation
+        self.output_slots = output_slots
+
+        # Pre-slice the links of each node so activate() only does math
+        self.nodes = []
+        for i in range(len(bias)):
+            start, end = link_ptr[i], link_ptr[i + 1]
+            self.nodes.append((
+                self.num_inputs + i,
+                ACTIVATION_FUNCTIONS[int(activation[i])],
+                float(bias[i]),
+                float(response[i]),
+                link_src[start:end],
+                link_weight[start:end],
+            ))
+
+    @classmethod
+    def load(cls, path="best_network.npz"):
+        """Load a network written by export_network"""
+        with np.load(path) as data:
+            version = int(data['format_version'])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported network file version: {version}")
+            return cls(
+                data['num_inputs'],
+                data['num_slots'],
+                data['bias'],
+                data['response'],
+                data['activation'],
+                data['link_ptr'],
+                data['link_src'],
+                data['link_weight'],
+                data['output_slots'],
+            )
+
+    def activate(self, states):
+        """
+        Evaluate a batch of states of shape (batch, num_inputs) and return
+        outputs of shape (batch, num_outputs). A single state is also
+        accepted and gives a single row of outputs.
+        """
+        states = np.asarray(states, dtype=np.float64)
+        single = states.ndim == 1
+        if single:
+            states = states[np.newaxis, :]
+        if states.ndim != 2 or states.shape[1] != self.num_inputs:
+            raise ValueError(f"Expected states with {self.num_inputs} inputs, got shape {states.shape}")
+
+        values = np.zeros((states.shape[0], self.num_slots))
+        values[:, :self.num_inputs] = states
+
+        for slot, act_func, bias, response, src, weight in self.nodes:
+            s = values[:, src] @ weight
+            values[:, slot] = act_func(bias + response * s)
+
+        outputs = values[:, self.output_slots]
+        return outputs[0] if single else outputs
+
+
+if __name__ == "__main__":
+    import pickle
+    import neat
+
+    config = neat.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        "neat_config.txt"
+    )
+    with open('best_genome.pkl', 'rb') as f:
+        genome = pickle.load(f)
+
+    export_network(genome, config, 'best_network.npz')
+    print("Winner network exported to best_network.npz")
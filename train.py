@@ -301,6 +301,11 @@ class NEATTrainer:
         print(f"Total cars that reached goal: {self.cars_reached_goal}")
         print("Winner genome saved to best_genome.pkl")
         
+        # Export a NumPy-only copy of the winner network
+        from inference import export_network
+        export_network(winner, config, 'best_network.npz')
+        print("Winner network exported to best_network.npz")
+        
         # Show winner performance
         print("\nRunning winner genome...")
         self.run_single_car(winner, config)